@@ -1,23 +1,139 @@
 import sys
 import os
+import errno
 import threading
 import time
 import configparser
-import psutil
-import subprocess
+from dataclasses import dataclass
+import queue
+import mmap
+import importlib.util
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QVBoxLayout, QWidget, 
                             QPushButton, QLabel, QProgressBar, QGroupBox,
                             QMessageBox, QHBoxLayout, QPlainTextEdit, QToolBar,
-                            QSizePolicy, QFrame)
-from PyQt5.QtCore import Qt, pyqtSignal, QObject
+                            QSizePolicy, QFrame, QDialog, QStyle)
+from PyQt5.QtCore import Qt, pyqtSignal, QObject, QTimer
 from PyQt5.QtGui import QColor, QPalette, QFont, QIcon
 
+# 内存池最小大小
+ARENA_MIN_SIZE = 64 * 1024 * 1024
+# 可用内存轮询间隔(秒)
+MEM_POLL_INTERVAL = 0.2
+# 落后于计划时单次最多补分配的块数，更多的积压直接放弃
+MAX_BATCH_BLOCKS = 64
+# 单次补分配的最大字节数，块较大时进一步限制批量
+MAX_BATCH_BYTES = 256 * 1024 * 1024
+# 单次提交的最大字节数：提交期间持有GIL，分段提交让界面线程能及时响应
+MAX_COMMIT_BYTES = 32 * 1024 * 1024
+# 字节转MB的系数，定时刷新时用乘法代替除法
+INV_MB = 1.0 / (1024 * 1024)
+# Linux 5.14+ 的 madvise 选项，一次系统调用预先提交整段页面
+MADV_POPULATE_WRITE = getattr(mmap, "MADV_POPULATE_WRITE", 23)
+# MemAvailable 位于 /proc/meminfo 开头几行，只读取这么多字节即可
+MEMINFO_READ_SIZE = 512
+
+# 按钮样式模板：通过对象名区分按钮，分别指定背景色、悬停色、禁用色
+BUTTON_STYLE = """
+    QPushButton#%(name)s {
+        background-color: %(normal)s;
+        color: white;
+        border: none;
+        border-radius: 5px;
+        padding: 8px;
+        font-weight: bold;
+        font-size: 12px;
+        min-width: 80px;
+    }
+    QPushButton#%(name)s:hover {
+        background-color: %(hover)s;
+    }
+    QPushButton#%(name)s:disabled {
+        background-color: %(disabled)s;
+        color: white;
+    }
+"""
+
+# 每个按钮独特的颜色
+BUTTON_COLORS = {
+    "startBtn": ("#4CAF50", "#45a049", "#a5d6a7"),
+    "stopBtn": ("#FF9800", "#e68a00", "#ffcc80"),
+    "emergencyBtn": ("#F44336", "#d32f2f", "#ffcdd2"),
+    "configBtn": ("#2196F3", "#0b7dda", "#bbdefb"),
+    "aboutBtn": ("#9C27B0", "#7B1FA2", "#e1bee7")
+}
+
+# 主窗口样式表，所有控件共用，Qt只需解析一次
+WINDOW_STYLE = "".join(
+    BUTTON_STYLE % {"name": name, "normal": normal, "hover": hover, "disabled": disabled}
+    for name, (normal, hover, disabled) in BUTTON_COLORS.items()
+) + """
+    QFrame#separator {
+        color: #d0d0d0;
+        margin: 5px 0;
+    }
+"""
+
+def open_meminfo():
+    """Linux下打开/proc/meminfo并保持打开，其他系统返回None"""
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        return os.open("/proc/meminfo", os.O_RDONLY)
+    except OSError:
+        return None
+
+# 常驻的 /proc/meminfo 文件描述符，每次查询只需一次 pread 系统调用
+MEMINFO_FD = open_meminfo()
+
+def get_available_memory():
+    """获取系统可用内存(字节)，Linux下直接读取/proc/meminfo"""
+    if MEMINFO_FD is not None:
+        try:
+            # pread 自带偏移量，界面线程和工作线程同时调用也不会互相干扰
+            data = os.pread(MEMINFO_FD, MEMINFO_READ_SIZE, 0)
+            start = data.index(b"MemAvailable:") + 13
+            return int(data[start:data.index(b"kB", start)]) * 1024
+        except (OSError, ValueError):
+            pass
+    # psutil 只在需要时导入，Linux 下启动时不加载
+    import psutil
+    return psutil.virtual_memory().available
+
+def parse_rgb(value):
+    """解析 "r,g,b" 格式的颜色值"""
+    r, g, b = map(int, value.split(","))
+    return r, g, b
+
+def spawn_detached(args):
+    """用posix_spawn启动外部程序，避免复制已占用大量内存的进程，并在后台回收子进程"""
+    pid = os.posix_spawnp(args[0], args, os.environ)
+    reaper = threading.Thread(target=os.waitpid, args=(pid, 0))
+    reaper.daemon = True
+    reaper.start()
+
+def parse_bool(value):
+    """解析 true/false、yes/no、on/off、1/0 格式的布尔值"""
+    try:
+        return configparser.ConfigParser.BOOLEAN_STATES[value.lower()]
+    except KeyError:
+        raise ValueError(f"Not a boolean: {value}")
+
 class MemorySignals(QObject):
     """自定义信号类"""
     update_signal = pyqtSignal(int, float, float)  # 进度, 已分配, 可用内存
     alert_signal = pyqtSignal(str)
     complete_signal = pyqtSignal()
 
+@dataclass
+class Settings:
+    """压榨相关配置，启动时一次性解析"""
+    block_size: int  # MB
+    allocations_per_second: int
+    reserve_percent: float
+    memory_limit: int  # MB
+    commit_memory: bool
+    log_file: str
+
 class ConfigManager:
     """配置文件管理"""
     def __init__(self):
@@ -25,20 +141,38 @@ class ConfigManager:
         self.app_dir = os.path.dirname(os.path.abspath(sys.argv[0]))
         self.config_file = os.path.join(self.app_dir, "config.ini")
         self.config = configparser.ConfigParser()
+        # 已解析配置值缓存，键为 (节, 键, 转换函数)
+        self.cache = {}
+        # 读取配置时发现的无效值，由主窗口启动后写入日志
+        self.warnings = []
         
         # 确保配置文件存在
         if not os.path.exists(self.config_file):
             self.create_default_config()
         
         self.config.read(self.config_file)
+        self.settings = self.load_settings()
+    
+    def load_settings(self):
+        """一次性读取压榨相关配置"""
+        return Settings(
+            block_size=self.get_positive_int("Settings", "BlockSize", 10),
+            allocations_per_second=self.get_positive_int("Settings", "AllocationsPerSecond", 500),
+            reserve_percent=self.get_float("Settings", "ReservePercent", 2.0),
+            memory_limit=self.get_int("Settings", "MemoryLimit", 256),
+            commit_memory=self.get_bool("Settings", "CommitMemory", True),
+            log_file=self.get_str("Logging", "LogFile", "memory_squeezer.log")
+        )
     
     def create_default_config(self):
         """创建默认配置文件"""
+        self.cache.clear()
         self.config["Settings"] = {
             "BlockSize": "10",
             "AllocationsPerSecond": "500",
             "ReservePercent": "2",
-            "MemoryLimit": "256"
+            "MemoryLimit": "256",
+            "CommitMemory": "true"
         }
         
         self.config["Window"] = {
@@ -57,31 +191,110 @@ class ConfigManager:
         with open(self.config_file, "w", encoding="utf-8") as f:
             self.config.write(f)
     
-    def get_int(self, section, key, default=0):
+    def get_value(self, section, key, default, convert):
+        """读取配置项并缓存转换结果"""
+        cache_key = (section, key, convert)
+        if cache_key in self.cache:
+            return self.cache[cache_key]
+        if not self.config.has_option(section, key):
+            return default
         try:
-            return self.config.getint(section, key)
-        except:
+            value = convert(self.config.get(section, key))
+        except (ValueError, configparser.Error):
             return default
+        self.cache[cache_key] = value
+        return value
+    
+    def get_int(self, section, key, default=0):
+        return self.get_value(section, key, default, int)
+    
+    def get_positive_int(self, section, key, default=1):
+        """读取正整数配置项，小于1时改为1并记录警告"""
+        value = self.get_int(section, key, default)
+        if value < 1:
+            self.warnings.append(f"配置项 {key}={value} 无效，已改为 1")
+            return 1
+        return value
     
     def get_float(self, section, key, default=0.0):
-        try:
-            return self.config.getfloat(section, key)
-        except:
-            return default
+        return self.get_value(section, key, default, float)
+    
+    def get_bool(self, section, key, default=False):
+        return self.get_value(section, key, default, parse_bool)
     
     def get_str(self, section, key, default=""):
-        try:
-            return self.config.get(section, key)
-        except:
-            return default
+        return self.get_value(section, key, default, str)
     
     def get_rgb(self, section, key, default=(0, 128, 255)):
-        try:
-            color_str = self.config.get(section, key)
-            r, g, b = map(int, color_str.split(","))
-            return r, g, b
-        except:
-            return default
+        return self.get_value(section, key, default, parse_rgb)
+
+class ConfirmDialog(QDialog):
+    """四重确认对话框 - 只构建一次，每次启动前复用"""
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        style = self.style()
+        self.icons = {
+            "question": style.standardIcon(QStyle.SP_MessageBoxQuestion).pixmap(32, 32),
+            "warning": style.standardIcon(QStyle.SP_MessageBoxWarning).pixmap(32, 32),
+            "critical": style.standardIcon(QStyle.SP_MessageBoxCritical).pixmap(32, 32)
+        }
+        
+        self.icon_label = QLabel()
+        self.icon_label.setAlignment(Qt.AlignTop)
+        self.text_label = QLabel()
+        self.text_label.setWordWrap(True)
+        self.accept_btn = QPushButton()
+        self.reject_btn = QPushButton()
+        self.accept_btn.clicked.connect(self.accept)
+        self.reject_btn.clicked.connect(self.reject)
+        
+        text_layout = QHBoxLayout()
+        text_layout.addWidget(self.icon_label)
+        text_layout.addWidget(self.text_label, 1)
+        
+        button_layout = QHBoxLayout()
+        button_layout.addStretch()
+        button_layout.addWidget(self.accept_btn)
+        button_layout.addWidget(self.reject_btn)
+        
+        layout = QVBoxLayout()
+        layout.addLayout(text_layout)
+        layout.addLayout(button_layout)
+        self.setLayout(layout)
+
+    def ask(self, title, text, icon, accept_text="Yes", reject_text="No"):
+        """显示一页确认内容，默认按钮为拒绝"""
+        self.setWindowTitle(title)
+        self.icon_label.setPixmap(self.icons[icon])
+        self.text_label.setText(text)
+        self.accept_btn.setText(accept_text)
+        self.reject_btn.setText(reject_text)
+        self.reject_btn.setDefault(True)
+        self.reject_btn.setFocus()
+        return self.exec_() == QDialog.Accepted
+
+    def run(self):
+        """依次显示四个确认页面，任一页面取消则返回False"""
+        if not self.ask('警告',
+                        '此程序将消耗大量系统内存，可能导致系统不稳定！\n\n确定要继续吗？',
+                        "question"):
+            return False
+        
+        if not self.ask('风险确认',
+                        '此操作可能导致以下严重后果：\n- 系统运行缓慢\n- 其他程序崩溃\n- 需要强制重启\n\n确认了解风险？',
+                        "warning"):
+            return False
+        
+        available_mem = get_available_memory()
+        if available_mem < 2 * 1024 * 1024 * 1024:  # 小于2GB
+            if not self.ask('内存不足',
+                            f'检测到当前系统可用内存较少 ({available_mem/(1024 * 1024):.2f} MB)，继续运行可能立即导致系统无响应\n\n仍要继续吗？',
+                            "critical"):
+                return False
+        
+        return self.ask('最终确认',
+                        '这是最后一次警告！\n按下确定后将开始不可逆的内存消耗过程\n\n确定执行？',
+                        "warning", "OK", "Cancel")
 
 class MemorySqueezerGUI(QMainWindow):
     """内存压榨器主窗口 - 修复按钮颜色问题"""
@@ -92,31 +305,63 @@ class MemorySqueezerGUI(QMainWindow):
         self.init_config()
         self.init_ui()
         self.connect_signals()
-        self.memory_alert_shown = False
+        self.confirm_dialog = ConfirmDialog(self)
         self.show_warning()
 
     def init_config(self):
         """初始化配置参数"""
-        self.allocated_blocks = []
-        self.block_size = self.config.get_int("Settings", "BlockSize", 10) * 1024 * 1024
+        self.arenas = []
+        # 已释放物理内存、保留映射的空闲内存池，下次压榨直接复用
+        self.free_arenas = []
+        self.squeeze_running = False
+        self.release_pending = False
+        self.populate_supported = sys.platform.startswith("linux")
+        self.decommit_supported = sys.platform.startswith("linux") and hasattr(mmap, "MADV_DONTNEED")
+        settings = self.config.settings
+        self.block_size = settings.block_size * 1024 * 1024
+        # 内存池：按大块连续内存(至少64MB)分配，再按块大小切分，避免大量小块造成碎片
+        self.arena_size = max(ARENA_MIN_SIZE, self.block_size) // self.block_size * self.block_size
         self.should_stop = threading.Event()
         self.total_allocated = 0
+        # 已分配量由工作线程累加、界面线程读取和清零，读写都在锁内完成
+        self.total_lock = threading.Lock()
         self.max_allocation = 0
-        self.memory_limit = self.config.get_int("Settings", "MemoryLimit", 256) * 1024 * 1024
-        self.reserve_percent = self.config.get_float("Settings", "ReservePercent", 2.0)
-        self.allocations_per_second = self.config.get_int("Settings", "AllocationsPerSecond", 500)
+        self.progress_scale = 0.0
+        self.memory_limit = settings.memory_limit * 1024 * 1024
+        self.reserve_percent = settings.reserve_percent
+        self.allocations_per_second = settings.allocations_per_second
+        # 关闭时只保留地址空间，不真正提交物理内存；
+        # Windows 下匿名映射创建时即计入提交量，该选项无效，始终视为提交
+        self.commit_memory = settings.commit_memory or sys.platform == "win32"
+        # 可用内存缓存，压榨期间由mem_timer刷新，工作线程和界面共用
+        self.available_memory = 0
+        # 缓存的刷新时间：界面线程被占用时缓存会过时，工作线程据此改为直接读取
+        self.available_time = 0.0
         
         # 获取日志文件路径
-        log_file_name = self.config.get_str("Logging", "LogFile", "memory_squeezer.log")
-        self.log_file = os.path.join(self.config.app_dir, log_file_name)
+        self.log_file = os.path.join(self.config.app_dir, settings.log_file)
         
         # 确保日志目录存在
         log_dir = os.path.dirname(self.log_file)
         if log_dir and not os.path.exists(log_dir):
             os.makedirs(log_dir)
         
-        with open(self.log_file, "w", encoding="utf-8") as f:
-            f.write(f"[{time.strftime('%Y-%m-%d %H:%M:%S')}] Memory Squeezer started\n")
+        # 日志文件保持打开，由写入线程按批刷新
+        self.log_handle = open(self.log_file, "w", encoding="utf-8", buffering=1 << 17)
+        self.log_handle.write(f"[{time.strftime('%Y-%m-%d %H:%M:%S')}] Memory Squeezer started\n")
+        
+        # 日志写入交给后台线程，避免磁盘IO阻塞界面
+        self.log_queue = queue.SimpleQueue()
+        self.log_thread = threading.Thread(target=self.log_writer)
+        self.log_thread.daemon = True
+        self.log_thread.start()
+        
+        # 常驻工作线程，每次开始压榨时由start_event唤醒，避免反复创建线程
+        self.start_event = threading.Event()
+        self.shutdown = False
+        self.worker_thread = threading.Thread(target=self.worker_loop)
+        self.worker_thread.daemon = True
+        self.worker_thread.start()
 
     def init_ui(self):
         """初始化用户界面 - 修复按钮颜色问题"""
@@ -143,6 +388,7 @@ class MemorySqueezerGUI(QMainWindow):
         # 添加关于按钮到工具栏右上角
         self.about_btn = QPushButton("关于我们")
         self.about_btn.setFixedSize(90, 30)
+        self.about_btn.setObjectName("aboutBtn")
         toolbar.addWidget(self.about_btn)
         
         # 主内容区域
@@ -159,6 +405,15 @@ class MemorySqueezerGUI(QMainWindow):
         self.available_label = QLabel("可用内存: 0 MB")
         self.progress_bar = QProgressBar()
         
+        # 压榨期间由界面线程定时刷新内存状态，工作线程不再逐块通知
+        self.stats_timer = QTimer(self)
+        self.stats_timer.setInterval(100)
+        self.stats_timer.timeout.connect(self.refresh_stats)
+        # 压榨期间在GUI线程上定时刷新可用内存缓存，无需单独的轮询线程
+        self.mem_timer = QTimer(self)
+        self.mem_timer.setInterval(int(MEM_POLL_INTERVAL * 1000))
+        self.mem_timer.timeout.connect(self.poll_memory)
+        
         status_layout.addWidget(self.allocated_label)
         status_layout.addWidget(self.available_label)
         status_layout.addWidget(self.progress_bar)
@@ -167,7 +422,7 @@ class MemorySqueezerGUI(QMainWindow):
         # 分隔线
         separator = QFrame()
         separator.setFrameShape(QFrame.HLine)
-        separator.setStyleSheet("color: #d0d0d0; margin: 5px 0;")
+        separator.setObjectName("separator")
         
         # 操作控制区域
         control_group = QGroupBox("操作控制")
@@ -179,8 +434,11 @@ class MemorySqueezerGUI(QMainWindow):
         self.emergency_btn = QPushButton("紧急停止")
         self.config_btn = QPushButton("配置")
         
-        # 设置按钮样式 - 确保所有按钮显示颜色
-        self.set_button_style()
+        # 按钮颜色由主窗口样式表按对象名设置
+        self.start_btn.setObjectName("startBtn")
+        self.stop_btn.setObjectName("stopBtn")
+        self.emergency_btn.setObjectName("emergencyBtn")
+        self.config_btn.setObjectName("configBtn")
         
         # 添加按钮到布局
         control_layout.addWidget(self.start_btn)
@@ -192,7 +450,7 @@ class MemorySqueezerGUI(QMainWindow):
         # 分隔线
         separator2 = QFrame()
         separator2.setFrameShape(QFrame.HLine)
-        separator2.setStyleSheet("color: #d0d0d0; margin: 5px 0;")
+        separator2.setObjectName("separator")
         
         # 日志显示区域
         log_group = QGroupBox("操作日志")
@@ -201,6 +459,15 @@ class MemorySqueezerGUI(QMainWindow):
         self.log_area = QPlainTextEdit()
         self.log_area.setReadOnly(True)
         self.log_area.setMinimumHeight(150)
+        # 限制日志行数，长时间运行时界面内存不会无限增长
+        self.log_area.setMaximumBlockCount(2000)
+        
+        # 日志先缓存，每100ms批量刷新到界面
+        self.log_buffer = []
+        self.log_timer = QTimer(self)
+        self.log_timer.setInterval(100)
+        self.log_timer.timeout.connect(self.flush_log)
+        self.log_timer.start()
         
         log_layout.addWidget(self.log_area)
         log_group.setLayout(log_layout)
@@ -214,6 +481,9 @@ class MemorySqueezerGUI(QMainWindow):
         main_widget.setLayout(layout)
         self.setCentralWidget(main_widget)
         
+        # 统一设置样式表 - 确保所有按钮显示颜色
+        self.setStyleSheet(WINDOW_STYLE)
+        
         # 初始按钮状态 - 所有按钮都启用并显示颜色
         self.start_btn.setEnabled(True)
         self.stop_btn.setEnabled(True)
@@ -222,41 +492,15 @@ class MemorySqueezerGUI(QMainWindow):
         
         # 初始化日志
         self.log("程序已启动")
+        for warning in self.config.warnings:
+            self.log(warning)
         self.log(f"块大小: {self.block_size/(1024 * 1024)}MB")
         self.log(f"分配速度: {self.allocations_per_second}次/秒")
         self.log(f"保留内存: {self.reserve_percent}%")
         self.log(f"安全限制: {self.memory_limit/(1024 * 1024)}MB")
+        self.log(f"提交内存: {'是' if self.commit_memory else '否(仅保留地址空间)'}")
         self.log("请点击'开始压榨'按钮启动内存压榨")
 
-    def set_button_style(self):
-        """设置按钮样式 - 确保所有按钮显示颜色"""
-        button_style = """
-            QPushButton {
-                background-color: %s;
-                color: white;
-                border: none;
-                border-radius: 5px;
-                padding: 8px;
-                font-weight: bold;
-                font-size: 12px;
-                min-width: 80px;
-            }
-            QPushButton:hover {
-                background-color: %s;
-            }
-            QPushButton:disabled {
-                background-color: %s;
-                color: white;
-            }
-        """
-        
-        # 为每个按钮设置独特的颜色
-        self.start_btn.setStyleSheet(button_style % ("#4CAF50", "#45a049", "#a5d6a7"))
-        self.stop_btn.setStyleSheet(button_style % ("#FF9800", "#e68a00", "#ffcc80"))
-        self.emergency_btn.setStyleSheet(button_style % ("#F44336", "#d32f2f", "#ffcdd2"))
-        self.config_btn.setStyleSheet(button_style % ("#2196F3", "#0b7dda", "#bbdefb"))
-        self.about_btn.setStyleSheet(button_style % ("#9C27B0", "#7B1FA2", "#e1bee7"))
-
     def connect_signals(self):
         """连接信号和槽"""
         self.start_btn.clicked.connect(self.start_squeeze)
@@ -265,8 +509,9 @@ class MemorySqueezerGUI(QMainWindow):
         self.config_btn.clicked.connect(self.open_config_file)
         self.about_btn.clicked.connect(self.show_about_dialog)
         self.signals.update_signal.connect(self.update_status)
-        self.signals.alert_signal.connect(self.show_alert)
-        self.signals.complete_signal.connect(self.on_complete)
+        # 以下信号由工作线程发出，显式排队到界面线程处理
+        self.signals.alert_signal.connect(self.show_alert, Qt.QueuedConnection)
+        self.signals.complete_signal.connect(self.on_complete, Qt.QueuedConnection)
 
     def show_about_dialog(self):
         """显示关于对话框"""
@@ -291,13 +536,13 @@ class MemorySqueezerGUI(QMainWindow):
                 os.startfile(config_path)
                 self.log("Windows系统打开配置文件")
             elif sys.platform == "darwin":
-                subprocess.run(["open", config_path])
+                spawn_detached(["open", config_path])
                 self.log("macOS系统打开配置文件")
             else:
                 editors = ["xdg-open", "gedit", "kate", "mousepad", "pluma", "nano"]
                 for editor in editors:
                     try:
-                        subprocess.Popen([editor, config_path])
+                        spawn_detached([editor, config_path])
                         self.log(f"使用 {editor} 打开配置文件")
                         break
                     except FileNotFoundError:
@@ -320,49 +565,25 @@ class MemorySqueezerGUI(QMainWindow):
     def update_status(self, progress, allocated, available):
         """更新UI状态"""
         self.progress_bar.setValue(progress)
-        self.allocated_label.setText(f"已分配: {allocated / (1024 * 1024):.2f} MB")
-        self.available_label.setText(f"可用内存: {available / (1024 * 1024):.2f} MB")
+        self.allocated_label.setText(f"已分配: {allocated * INV_MB:.2f} MB")
+        self.available_label.setText(f"可用内存: {available * INV_MB:.2f} MB")
+
+    def refresh_stats(self):
+        """定时读取分配进度并刷新界面"""
+        total, available = self.snapshot()
+        self.update_status(int(total * self.progress_scale), total, available)
+
+    def snapshot(self):
+        """返回一致的 (已分配量, 可用内存)"""
+        with self.total_lock:
+            total = self.total_allocated
+        return total, self.available_memory
 
     def show_warning(self):
         """显示四重确认对话框"""
-        reply = QMessageBox.question(
-            self, '警告', 
-            '此程序将消耗大量系统内存，可能导致系统不稳定！\n\n确定要继续吗？',
-            QMessageBox.Yes | QMessageBox.No, QMessageBox.No)
-        
-        if reply != QMessageBox.Yes:
-            self.log("用户取消操作")
-            return False
-            
-        reply = QMessageBox.warning(
-            self, '风险确认',
-            '此操作可能导致以下严重后果：\n- 系统运行缓慢\n- 其他程序崩溃\n- 需要强制重启\n\n确认了解风险？',
-            QMessageBox.Yes | QMessageBox.No, QMessageBox.No)
-            
-        if reply != QMessageBox.Yes:
-            self.log("用户取消操作")
-            return False
-            
-        available_mem = psutil.virtual_memory().available
-        if available_mem < 2 * 1024 * 1024 * 1024:  # 小于2GB
-            reply = QMessageBox.critical(
-                self, '内存不足',
-                f'检测到当前系统可用内存较少 ({available_mem/(1024 * 1024):.2f} MB)，继续运行可能立即导致系统无响应\n\n仍要继续吗？',
-                QMessageBox.Yes | QMessageBox.No, QMessageBox.No)
-                
-            if reply != QMessageBox.Yes:
-                self.log("用户取消操作")
-                return False
-                
-        reply = QMessageBox.warning(
-            self, '最终确认',
-            '这是最后一次警告！\n按下确定后将开始不可逆的内存消耗过程\n\n确定执行？',
-            QMessageBox.Ok | QMessageBox.Cancel, QMessageBox.Cancel)
-            
-        if reply != QMessageBox.Ok:
+        if not self.confirm_dialog.run():
             self.log("用户取消操作")
             return False
-            
         return True
 
     def start_squeeze(self):
@@ -372,70 +593,187 @@ class MemorySqueezerGUI(QMainWindow):
             
         # 禁用开始按钮
         self.start_btn.setEnabled(False)
+        self.squeeze_running = True
         
-        available_mem = psutil.virtual_memory().available
+        # 先回收上一轮的内存池，再计算可用内存
+        self.release_arenas()
+        available_mem = get_available_memory()
         reserve = available_mem * (self.reserve_percent / 100)
         self.max_allocation = available_mem - reserve
+        # 进度百分比的换算系数，每轮只算一次，刷新时用乘法代替除法；
+        # 目标为0(如保留100%)时本轮不分配，直接结束
+        self.progress_scale = 100.0 / self.max_allocation if self.max_allocation > 0 else 0.0
         
         self.log("=== 内存压榨启动 ===")
-        self.log(f"目标分配量: {self.max_allocation / (1024 * 1024):.2f} MB")
-        self.log(f"保留内存: {reserve / (1024 * 1024):.2f} MB ({self.reserve_percent}%)")
+        self.log(f"目标分配量: {self.max_allocation * INV_MB:.2f} MB")
+        self.log(f"保留内存: {reserve * INV_MB:.2f} MB ({self.reserve_percent}%)")
         self.log(f"分配速度: {self.allocations_per_second} 次/秒")
         
-        self.allocated_blocks = []
+        # 按目标分配量一次性确定内存池列表长度，运行中不再扩容
+        target = -(-int(self.max_allocation) // self.block_size) * self.block_size
+        self.arenas = [None] * -(-target // self.arena_size)
+        # 每页写入一个字节即可让系统真正提交内存，无需整块填充
+        self.touch_pattern = b"\x01" * -(-self.block_size // mmap.PAGESIZE)
         self.total_allocated = 0
         self.should_stop.clear()
         
-        self.worker_thread = threading.Thread(target=self.squeeze_memory)
-        self.worker_thread.daemon = True
-        self.worker_thread.start()
+        self.available_memory = available_mem
+        self.available_time = time.monotonic()
+        self.mem_timer.start()
         
-        self.monitor_thread = threading.Thread(target=self.monitor_memory)
-        self.monitor_thread.daemon = True
-        self.monitor_thread.start()
+        self.start_event.set()
+        self.stats_timer.start()
 
     def squeeze_memory(self):
         """内存压榨核心逻辑"""
         try:
             interval = 1.0 / self.allocations_per_second
-            next_alloc_time = time.time()
+            next_alloc_time = time.monotonic()
+            # 循环中使用本地引用
+            arenas = self.arenas
+            arena = None
+            arena_index = 0
             
-            while not self.should_stop.is_set() and self.total_allocated < self.max_allocation:
-                current_time = time.time()
-                if current_time >= next_alloc_time:
-                    block = bytearray(self.block_size)
-                    self.allocated_blocks.append(block)
-                    self.total_allocated += self.block_size
-                    next_alloc_time += interval
-                    
-                    progress = (self.total_allocated / self.max_allocation) * 100
-                    available = psutil.virtual_memory().available
-                    self.signals.update_signal.emit(int(progress), self.total_allocated, available)
-                    
-                    if available < self.memory_limit:
-                        self.signals.alert_signal.emit("系统可用内存低于安全限制，自动停止")
+            # 循环中频繁使用的属性和方法绑定为局部变量
+            stop_is_set = self.should_stop.is_set
+            stop_wait = self.should_stop.wait
+            monotonic = time.monotonic
+            commit_block = self.commit_block
+            block_size = self.block_size
+            max_allocation = self.max_allocation
+            memory_limit = self.memory_limit
+            commit_memory = self.commit_memory
+            total_lock = self.total_lock
+            offset = arena_end = 0
+            batch_limit = max(1, min(MAX_BATCH_BLOCKS, MAX_BATCH_BYTES // block_size))
+            commit_limit = max(1, MAX_COMMIT_BYTES // block_size)
+            # 余量不足两个轮询周期或一整批的分配量时，缓存值可能已过时，改为直接读取
+            near_limit = max(2 * MEM_POLL_INTERVAL * self.allocations_per_second, batch_limit) * block_size
+            stale_after = 2 * MEM_POLL_INTERVAL
+            
+            while self.total_allocated < max_allocation:
+                # 等待到下一次分配时间，收到停止信号时立即返回；
+                # 落后于计划不需要等待时，每批检查一次停止标志
+                now = monotonic()
+                delay = next_alloc_time - now
+                if delay > 0:
+                    if stop_wait(delay):
+                        break
+                    due = 1
+                else:
+                    if stop_is_set():
                         break
+                    # 一次补齐所有已到期的块，超出批量上限的积压直接放弃
+                    due = int(-delay / interval) + 1
+                    if due > batch_limit:
+                        due = batch_limit
+                        next_alloc_time = now
+                
+                available = self.available_memory
+                if (available - memory_limit < near_limit
+                        or monotonic() - self.available_time > stale_after):
+                    available = get_available_memory()
+                if available < memory_limit:
+                    self.signals.alert_signal.emit("系统可用内存低于安全限制，自动停止")
+                    self.should_stop.set()
+                    break
+                
+                # 批量大小不超过剩余目标和安全余量
+                remaining_blocks = -(-(max_allocation - self.total_allocated) // block_size)
+                headroom_blocks = max(1, (available - memory_limit) // block_size)
+                due = int(min(due, remaining_blocks, headroom_blocks))
+                next_alloc_time += due * interval
                 
-                time.sleep(0.001)
+                while due > 0:
+                    # 每段提交前检查停止标志，收到停止信号时放弃本批剩余的块
+                    if stop_is_set():
+                        break
+                    if offset >= arena_end:
+                        arena = self.new_arena()
+                        arenas[arena_index] = arena
+                        arena_index += 1
+                        arena_end = len(arena)
+                        offset = 0
+                    # 同一内存池内连续的块合并提交，每次不超过 MAX_COMMIT_BYTES
+                    count = min(due, (arena_end - offset) // block_size, commit_limit)
+                    if commit_memory:
+                        commit_block(arena, offset, count)
+                    offset += count * block_size
+                    due -= count
+                    with total_lock:
+                        self.total_allocated += count * block_size
                 
         except MemoryError:
             self.signals.alert_signal.emit("内存耗尽!")
+        except OSError as e:
+            # 内存映射和预先提交在内存耗尽时抛出 ENOMEM，而不是 MemoryError
+            if e.errno == errno.ENOMEM:
+                self.signals.alert_signal.emit("内存耗尽!")
+            else:
+                self.signals.alert_signal.emit(f"发生错误: {str(e)}")
         except Exception as e:
             self.signals.alert_signal.emit(f"发生错误: {str(e)}")
         finally:
             self.signals.complete_signal.emit()
 
-    def monitor_memory(self):
-        """监控内存状态"""
-        while not self.should_stop.is_set():
-            available = psutil.virtual_memory().available
-            if available < self.memory_limit:
-                if not self.memory_alert_shown:
-                    self.signals.alert_signal.emit("系统可用内存低于安全限制，自动停止")
-                    self.memory_alert_shown = True
-                self.should_stop.set()
-                break
-            time.sleep(0.5)
+    def worker_loop(self):
+        """常驻工作线程：等待开始信号，执行一轮压榨后继续等待"""
+        while True:
+            self.start_event.wait()
+            self.start_event.clear()
+            if self.shutdown:
+                return
+            self.squeeze_memory()
+
+    def poll_memory(self):
+        """刷新可用内存缓存(由mem_timer定时调用)"""
+        self.available_memory = get_available_memory()
+        self.available_time = time.monotonic()
+
+    def new_arena(self):
+        """分配一个新的内存池，大小不超过剩余目标分配量"""
+        remaining = int(self.max_allocation - self.total_allocated)
+        remaining = -(-remaining // self.block_size) * self.block_size
+        size = min(self.arena_size, remaining)
+        if size == self.arena_size and self.free_arenas:
+            return self.free_arenas.pop()
+        # POSIX 下匿名映射只保留地址空间，页面在首次写入时才由系统分配
+        arena = mmap.mmap(-1, size)
+        # 尽量使用透明大页，减少页表项和缺页次数
+        if hasattr(mmap, "MADV_HUGEPAGE"):
+            try:
+                arena.madvise(mmap.MADV_HUGEPAGE)
+            except OSError:
+                pass
+        return arena
+
+    def release_arenas(self):
+        """释放内存池占用的物理内存，完整大小的内存池保留映射供下次复用"""
+        self.release_pending = False
+        for arena in self.arenas:
+            if arena is None:
+                continue
+            if self.decommit_supported and len(arena) == self.arena_size:
+                arena.madvise(mmap.MADV_DONTNEED)
+                self.free_arenas.append(arena)
+            else:
+                arena.close()
+        self.arenas = []
+
+    def commit_block(self, arena, offset, count=1):
+        """强制提交内存池中从 offset 开始的 count 个块"""
+        size = count * self.block_size
+        if self.populate_supported:
+            try:
+                arena.madvise(MADV_POPULATE_WRITE, offset, size)
+                return
+            except OSError as e:
+                # 旧内核不支持时退回按页写入
+                if e.errno != errno.EINVAL:
+                    raise
+                self.populate_supported = False
+        for start in range(offset, offset + size, self.block_size):
+            arena[start:start + self.block_size:mmap.PAGESIZE] = self.touch_pattern
 
     def graceful_stop(self):
         """安全停止"""
@@ -446,13 +784,27 @@ class MemorySqueezerGUI(QMainWindow):
         """紧急停止"""
         self.log("紧急停止中...")
         self.should_stop.set()
-        self.allocated_blocks = []
-        self.total_allocated = 0
-        available = psutil.virtual_memory().available
+        # 工作线程仍在写入时等它退出后(on_complete)再释放并清零统计
+        if self.squeeze_running:
+            self.release_pending = True
+            return
+        self.release_arenas()
+        with self.total_lock:
+            self.total_allocated = 0
+        available = get_available_memory()
         self.signals.update_signal.emit(0, 0, available)
 
     def on_complete(self):
         """操作完成处理"""
+        self.squeeze_running = False
+        if self.release_pending:
+            self.release_arenas()
+            with self.total_lock:
+                self.total_allocated = 0
+        self.stats_timer.stop()
+        self.mem_timer.stop()
+        self.available_memory = get_available_memory()
+        self.refresh_stats()
         self.log("操作完成")
         self.log(f"最终分配量: {self.total_allocated / (1024 * 1024):.2f} MB")
         self.start_btn.setEnabled(True)
@@ -461,14 +813,36 @@ class MemorySqueezerGUI(QMainWindow):
         """记录日志"""
         timestamp = time.strftime('%H:%M:%S')
         log_entry = f"[{timestamp}] {message}"
-        self.log_area.appendPlainText(log_entry)
-        self.log_area.verticalScrollBar().setValue(self.log_area.verticalScrollBar().maximum())
-        with open(self.log_file, "a", encoding="utf-8") as f:
-            f.write(log_entry + "\n")
+        self.log_buffer.append(log_entry)
+        self.log_queue.put_nowait(log_entry + "\n")
+
+    def flush_log(self):
+        """将缓存的日志批量显示到界面"""
+        if not self.log_buffer:
+            return
+        self.log_area.appendPlainText("\n".join(self.log_buffer))
+        self.log_buffer.clear()
+
+    def log_writer(self):
+        """后台日志写入线程，一次取出队列中所有日志批量写入"""
+        running = True
+        while running:
+            batch = [self.log_queue.get()]
+            while True:
+                try:
+                    batch.append(self.log_queue.get_nowait())
+                except queue.Empty:
+                    break
+            if None in batch:
+                running = False
+                batch = batch[:batch.index(None)]
+            self.log_handle.write("".join(batch))
+            self.log_handle.flush()
+        self.log_handle.close()
 
     def closeEvent(self, event):
         """窗口关闭事件"""
-        if hasattr(self, 'worker_thread') and self.worker_thread.is_alive():
+        if self.squeeze_running:
             confirm = QMessageBox.question(
                 self, "确认退出",
                 "内存压榨仍在进行中，确定要退出吗？",
@@ -478,13 +852,16 @@ class MemorySqueezerGUI(QMainWindow):
                 return
         
         self.should_stop.set()
-        self.allocated_blocks = []
+        self.shutdown = True
+        self.start_event.set()
+        self.arenas = []
+        self.log_queue.put(None)
+        self.log_thread.join()
         event.accept()
 
 if __name__ == "__main__":
-    try:
-        import psutil
-    except ImportError:
+    # 只检查依赖是否安装，不在启动时导入
+    if importlib.util.find_spec("psutil") is None:
         print("请先安装依赖库: pip install psutil")
         sys.exit(1)
     